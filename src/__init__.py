@@ -12,17 +12,25 @@ illustrate common patterns:
 - Adding a Tools menu action via `mw.form.menuTools`
 - Accessing `mw` (main window) and `mw.col` (collection)
 - Running background tasks to avoid blocking the UI
+- Logging from hooks through a module-level `logging` logger
 
 Note: When testing these snippets, put this file into Anki's add-ons
 folder and restart Anki.
 """
 
+#import logging
+#_log = logging.getLogger(__name__)
+# Anki already attaches a handler to the root logger; only the level is
+# needed for the DEBUG messages below to show up.
+#_log.setLevel(logging.DEBUG)
+
 #try:
 	# Typical imports available when running inside Anki
 	#from aqt import mw, gui_hooks
     #Find the hooks and their variables under: https://github.com/ankitects/anki/blob/main/qt/tools/genhooks_gui.py
 	#from aqt.qt import QAction
 	#from aqt.utils import showInfo
+	#from aqt.operations import QueryOp
 #except Exception:
 	# If this file is imported outside Anki (for linting or packaging),
 	# keep everything as no-op to avoid import errors.
@@ -30,6 +38,7 @@ folder and restart Anki.
 	#gui_hooks = None
 	#QAction = None
 	#showInfo = None
+	#QueryOp = None
 
 
 ###############################################################################
@@ -52,22 +61,13 @@ if gui_hooks:
 # Example 2: react to reviewer events (question/answer shown)
 ###############################################################################
 """
-def _on_question_shown(reviewer):
-	# reviewer is the reviewer instance. Keep actions light-weight.
-	try:
-		card = getattr(reviewer, 'card', None)
-		cid = getattr(card, 'id', None)
-		# simple debug print — in Anki this goes to its console/log
-		print(f"[example_addon] Question shown, card id={cid}")
-	except Exception:
-		pass
+def _on_question_shown(card):
+	# card is the Card being reviewed. Keep actions light-weight.
+	_log.debug("Question shown, card id=%s", card.id)
 
 
-def _on_answer_shown(reviewer):
-	try:
-		print("[example_addon] Answer shown")
-	except Exception:
-		pass
+def _on_answer_shown(card):
+	_log.debug("Answer shown, card id=%s", card.id)
 
 
 if gui_hooks:
@@ -115,29 +115,31 @@ if mw:
 ###############################################################################
 """
 def _do_background_work(data):
-	# Example long-running work (network, heavy computation, db ops)
+	# Example long-running work (network, heavy computation, db ops).
+	# This runs on a worker thread: do not touch widgets or call showInfo here.
 	import time
 	time.sleep(1)
-	# When done, if you need to update UI, schedule it on main thread
-	try:
-		if mw and showInfo:
-			# showInfo must be called on the main thread; small examples
-			# often work from here, but prefer using QTimer.singleShot
-			# or gui_hooks to schedule UI updates in real addons.
-			showInfo(f"Background task finished: {data}")
-	except Exception:
-		pass
+	return data
+
+
+def _on_background_work_done(data):
+	# Called back on the main (GUI) thread once the worker has finished,
+	# so it is safe to update the UI from here.
+	if showInfo:
+		showInfo(f"Background task finished: {data}")
 
 
 def _start_background_work(data="hello"):
-	# Start a thread for background work so the UI stays responsive
-	try:
-		import threading
-		t = threading.Thread(target=_do_background_work, args=(data,))
-		t.daemon = True
-		t.start()
-	except Exception:
-		pass
+	# QueryOp runs the work on Anki's thread pool and hands the result back
+	# to the main thread. The work doesn't touch the collection, so
+	# without_collection() keeps it from waiting behind collection ops.
+	if not mw or not QueryOp:
+		return
+	QueryOp(
+		parent=mw,
+		op=lambda col: _do_background_work(data),
+		success=_on_background_work_done,
+	).without_collection().run_in_background()
 """
 
 ###############################################################################